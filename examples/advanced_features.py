@@ -1,5 +1,6 @@
 """Advanced features: camera control, motion brush, lip-sync."""
 
+import asyncio
 import os
 from kling import KlingClient
 
@@ -106,8 +107,26 @@ print("\n" + "=" * 50)
 print("Example 5: Advanced Lip Sync")
 print("=" * 50)
 
-# Step 1: Identify faces in the video
-faces = client.lip_sync.identify_faces(video_id="your-video-id")
+# Steps 1 and 2 are independent: identify faces in the video and create the
+# TTS audio concurrently instead of one after the other. The async client is
+# bound to the event loop asyncio.run creates, so close it before that loop
+# ends; the surrounding "with" closes the sync side.
+async def identify_faces_and_speak(aclient):
+    try:
+        return await asyncio.gather(
+            aclient.lip_sync.identify_faces_async(video_id="your-video-id"),
+            aclient.tts.create_async(
+                text="Hello, this is a lip-sync test!",
+                voice_id="voice_001",
+                voice_language="en",
+            ),
+        )
+    finally:
+        await aclient.close_async()
+
+
+with KlingClient(access_key=access_key, secret_key=secret_key) as aclient:
+    faces, tts_result = asyncio.run(identify_faces_and_speak(aclient))
 
 print(f"Session ID: {faces.session_id}")
 print(f"Found {len(faces.face_data)} faces:")
@@ -116,13 +135,6 @@ for face in faces.face_data:
     print(f"    Time range: {face.start_time}ms - {face.end_time}ms")
     print(f"    Preview: {face.face_image}")
 
-# Step 2: Create TTS audio
-tts_result = client.tts.create(
-    text="Hello, this is a lip-sync test!",
-    voice_id="voice_001",
-    voice_language="en",
-)
-
 audio_id = tts_result.task_result.audios[0].id
 audio_duration_ms = int(float(tts_result.task_result.audios[0].duration) * 1000)
 
@@ -1,15 +1,25 @@
 """Async usage examples for Kling AI SDK."""
 
 import asyncio
+import importlib.util
 import os
 from kling import KlingClient
 
 
-async def main():
-    # Initialize client
-    access_key = os.getenv("KLING_ACCESS_KEY", "ak-your-access-key")
-    secret_key = os.getenv("KLING_SECRET_KEY", "your-secret-key")
-    client = KlingClient(access_key=access_key, secret_key=secret_key)
+async def gather_or_cancel(*aws):
+    """Like asyncio.gather, but cancel the rest as soon as one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def main(client: KlingClient):
+    # Open the connection pool before the first burst of requests
+    await client.warmup_async()
 
     # Example 1: Create multiple videos concurrently
     print("=" * 50)
@@ -22,8 +32,9 @@ async def main():
         "Waves crashing on a beach",
     ]
 
-    # Create all tasks concurrently
-    tasks = await asyncio.gather(
+    # Create all tasks concurrently, cancelling the remaining requests as soon
+    # as one of them fails
+    tasks = await gather_or_cancel(
         *[
             client.text_to_video.create_async(
                 model_name="kling-v2-1-master",
@@ -39,14 +50,12 @@ async def main():
     for i, task in enumerate(tasks):
         print(f"  {i+1}. {task.task_id} - {prompts[i]}")
 
-    # Wait for all to complete
+    # Wait for all to complete; a failed task cancels the other in-flight polls
     print("\nWaiting for all tasks to complete...")
-    results = await asyncio.gather(
-        *[
-            client.text_to_video.wait_for_completion_async(task.task_id, poll_interval=5.0)
-            for task in tasks
-        ]
+    completed = await client.text_to_video.wait_for_many_async(
+        [task.task_id for task in tasks], poll_interval=5.0
     )
+    results = [completed[task.task_id] for task in tasks]
 
     print("\n✅ All tasks completed!")
     for i, result in enumerate(results):
@@ -104,4 +113,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Initialize client. uvloop speeds up socket-heavy asyncio workloads; the
+    # client installs it when asked, which must happen before asyncio.run
+    # creates the event loop (pip install 'kling-sdk[uvloop]').
+    client = KlingClient(
+        access_key=os.getenv("KLING_ACCESS_KEY", "ak-your-access-key"),
+        secret_key=os.getenv("KLING_SECRET_KEY", "your-secret-key"),
+        use_uvloop=importlib.util.find_spec("uvloop") is not None,
+    )
+    asyncio.run(main(client))
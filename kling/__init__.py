@@ -1,4 +1,11 @@
-"""Kling AI Python SDK."""
+"""Kling AI Python SDK.
+
+Applications that run many concurrent ``*_async`` calls (for example
+``asyncio.gather`` over ``create_async`` and ``wait_for_completion_async``)
+can install the ``uvloop`` extra and pass ``KlingClient(..., use_uvloop=True)``
+before starting their event loop for faster socket handling on Linux and
+macOS.
+"""
 
 from kling.client import KlingClient
 from kling.exceptions import KlingError, KlingAPIError, KlingValidationError
@@ -1,123 +1,119 @@
 """Audio generation APIs - Text to Audio, Video to Audio, TTS."""
 
-from typing import List
-from kling.base import BaseAPIClient
-from kling.models.audio import TextToAudioRequest, VideoToAudioRequest, TTSRequest
-from kling.models.common import TaskResponse, APIResponse
-
-
-class TextToAudioAPI:
+from typing import Optional
+from kling.base import Endpoint, TaskEndpoint
+from kling.models.audio import (
+    TextToAudioRequest,
+    VideoToAudioRequest,
+    TTSRequest,
+    VoiceLanguage,
+)
+from kling.models.common import TaskResponse
+
+
+class TextToAudioAPI(TaskEndpoint):
     """Text to audio API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        self.client = client
-        self.endpoint = "/v1/audio/text-to-audio"
+    endpoint = "/v1/audio/text-to-audio"
 
-    def create(self, **kwargs) -> TaskResponse:
-        """Create a text-to-audio task."""
-        request = TextToAudioRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = self.client.post(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def create_async(self, **kwargs) -> TaskResponse:
-        request = TextToAudioRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = await self.client.post_async(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def get(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def get_async(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def wait_for_completion(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
+    def create(
+        self,
+        *,
+        prompt: str,
+        duration: float,
+        external_task_id: Optional[str] = None,
+        callback_url: Optional[str] = None,
     ) -> TaskResponse:
-        return self.client.wait_for_completion(
-            task_id=task_id, get_task_func=self.get, poll_interval=poll_interval, timeout=timeout
+        """Create a text-to-audio task."""
+        request = TextToAudioRequest(
+            prompt=prompt,
+            duration=duration,
+            external_task_id=external_task_id,
+            callback_url=callback_url,
         )
-
-    async def wait_for_completion_async(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
+        return self._submit(request)
+
+    async def create_async(
+        self,
+        *,
+        prompt: str,
+        duration: float,
+        external_task_id: Optional[str] = None,
+        callback_url: Optional[str] = None,
     ) -> TaskResponse:
-        return await self.client.wait_for_completion_async(
-            task_id=task_id,
-            get_task_func=self.get_async,
-            poll_interval=poll_interval,
-            timeout=timeout,
+        request = TextToAudioRequest(
+            prompt=prompt,
+            duration=duration,
+            external_task_id=external_task_id,
+            callback_url=callback_url,
         )
+        return await self._submit_async(request)
 
 
-class VideoToAudioAPI:
+class VideoToAudioAPI(TaskEndpoint):
     """Video to audio API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        self.client = client
-        self.endpoint = "/v1/audio/video-to-audio"
-
-    def create(self, **kwargs) -> TaskResponse:
-        """Create a video-to-audio task."""
-        request = VideoToAudioRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = self.client.post(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def create_async(self, **kwargs) -> TaskResponse:
-        request = VideoToAudioRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = await self.client.post_async(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def get(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def get_async(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def wait_for_completion(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
+    endpoint = "/v1/audio/video-to-audio"
+
+    def create(
+        self,
+        *,
+        video_id: Optional[str] = None,
+        video_url: Optional[str] = None,
+        sound_effect_prompt: Optional[str] = None,
+        bgm_prompt: Optional[str] = None,
+        asmr_mode: bool = False,
+        external_task_id: Optional[str] = None,
+        callback_url: Optional[str] = None,
     ) -> TaskResponse:
-        return self.client.wait_for_completion(
-            task_id=task_id, get_task_func=self.get, poll_interval=poll_interval, timeout=timeout
+        """Create a video-to-audio task."""
+        request = VideoToAudioRequest(
+            video_id=video_id,
+            video_url=video_url,
+            sound_effect_prompt=sound_effect_prompt,
+            bgm_prompt=bgm_prompt,
+            asmr_mode=asmr_mode,
+            external_task_id=external_task_id,
+            callback_url=callback_url,
         )
-
-    async def wait_for_completion_async(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
+        return self._submit(request)
+
+    async def create_async(
+        self,
+        *,
+        video_id: Optional[str] = None,
+        video_url: Optional[str] = None,
+        sound_effect_prompt: Optional[str] = None,
+        bgm_prompt: Optional[str] = None,
+        asmr_mode: bool = False,
+        external_task_id: Optional[str] = None,
+        callback_url: Optional[str] = None,
     ) -> TaskResponse:
-        return await self.client.wait_for_completion_async(
-            task_id=task_id,
-            get_task_func=self.get_async,
-            poll_interval=poll_interval,
-            timeout=timeout,
+        request = VideoToAudioRequest(
+            video_id=video_id,
+            video_url=video_url,
+            sound_effect_prompt=sound_effect_prompt,
+            bgm_prompt=bgm_prompt,
+            asmr_mode=asmr_mode,
+            external_task_id=external_task_id,
+            callback_url=callback_url,
         )
+        return await self._submit_async(request)
 
 
-class TTSAPI:
+class TTSAPI(Endpoint):
     """Text-to-speech API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        self.client = client
-        self.endpoint = "/v1/audio/tts"
+    endpoint = "/v1/audio/tts"
 
-    def create(self, **kwargs) -> TaskResponse:
+    def create(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        voice_language: VoiceLanguage,
+        voice_speed: float = 1.0,
+    ) -> TaskResponse:
         """Create a TTS task.
 
         Returns immediately with audio in task_result.
@@ -130,15 +126,26 @@ class TTSAPI:
             ... )
             >>> audio_url = result.task_result.audios[0].url
         """
-        request = TTSRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = self.client.post(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def create_async(self, **kwargs) -> TaskResponse:
-        request = TTSRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = await self.client.post_async(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
+        request = TTSRequest(
+            text=text,
+            voice_id=voice_id,
+            voice_language=voice_language,
+            voice_speed=voice_speed,
+        )
+        return self._submit(request)
+
+    async def create_async(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        voice_language: VoiceLanguage,
+        voice_speed: float = 1.0,
+    ) -> TaskResponse:
+        request = TTSRequest(
+            text=text,
+            voice_id=voice_id,
+            voice_language=voice_language,
+            voice_speed=voice_speed,
+        )
+        return await self._submit_async(request)
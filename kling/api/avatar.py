@@ -1,24 +1,37 @@
 """Avatar API."""
 
-from typing import List
-from kling.base import BaseAPIClient
+from typing import Optional
+from kling.base import TaskEndpoint
 from kling.models.avatar import AvatarRequest
-from kling.models.common import TaskResponse, APIResponse
+from kling.models.common import TaskResponse, VideoMode
 
 
-class AvatarAPI:
+class AvatarAPI(TaskEndpoint):
     """Avatar API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        """Initialize the avatar API."""
-        self.client = client
-        self.endpoint = "/v1/videos/avatar/image2video"
+    endpoint = "/v1/videos/avatar/image2video"
 
-    def create(self, **kwargs) -> TaskResponse:
+    def create(
+        self,
+        *,
+        image: str,
+        audio_id: Optional[str] = None,
+        sound_file: Optional[str] = None,
+        prompt: Optional[str] = None,
+        mode: VideoMode = "std",
+        callback_url: Optional[str] = None,
+        external_task_id: Optional[str] = None,
+    ) -> TaskResponse:
         """Create an avatar generation task.
 
         Args:
-            **kwargs: Parameters matching AvatarRequest model
+            image: Avatar reference image (Base64 or URL)
+            audio_id: Audio ID from the TTS API
+            sound_file: Sound file (Base64 or URL), instead of audio_id
+            prompt: Text prompt
+            mode: Video generation mode
+            callback_url: Callback URL
+            external_task_id: External task ID
 
         Returns:
             Task response with task_id
@@ -30,100 +43,37 @@ class AvatarAPI:
             ...     prompt="Speaking with emotion"
             ... )
         """
-        request = AvatarRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = self.client.post(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    async def create_async(self, **kwargs) -> TaskResponse:
-        """Create an avatar generation task asynchronously."""
-        request = AvatarRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = await self.client.post_async(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    def get(self, task_id: str) -> TaskResponse:
-        """Get task status."""
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    async def get_async(self, task_id: str) -> TaskResponse:
-        """Get task status asynchronously."""
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    def list(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        """List avatar tasks."""
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = self.client.get(self.endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    async def list_async(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        """List avatar tasks asynchronously."""
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = await self.client.get_async(self.endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    def wait_for_completion(
-        self,
-        task_id: str,
-        poll_interval: float = 5.0,
-        timeout: float = 600.0,
-    ) -> TaskResponse:
-        """Wait for task to complete."""
-        return self.client.wait_for_completion(
-            task_id=task_id,
-            get_task_func=self.get,
-            poll_interval=poll_interval,
-            timeout=timeout,
+        request = AvatarRequest(
+            image=image,
+            audio_id=audio_id,
+            sound_file=sound_file,
+            prompt=prompt,
+            mode=mode,
+            callback_url=callback_url,
+            external_task_id=external_task_id,
         )
+        return self._submit(request)
 
-    async def wait_for_completion_async(
+    async def create_async(
         self,
-        task_id: str,
-        poll_interval: float = 5.0,
-        timeout: float = 600.0,
+        *,
+        image: str,
+        audio_id: Optional[str] = None,
+        sound_file: Optional[str] = None,
+        prompt: Optional[str] = None,
+        mode: VideoMode = "std",
+        callback_url: Optional[str] = None,
+        external_task_id: Optional[str] = None,
     ) -> TaskResponse:
-        """Wait for task to complete asynchronously."""
-        return await self.client.wait_for_completion_async(
-            task_id=task_id,
-            get_task_func=self.get_async,
-            poll_interval=poll_interval,
-            timeout=timeout,
+        """Create an avatar generation task asynchronously."""
+        request = AvatarRequest(
+            image=image,
+            audio_id=audio_id,
+            sound_file=sound_file,
+            prompt=prompt,
+            mode=mode,
+            callback_url=callback_url,
+            external_task_id=external_task_id,
         )
+        # Base64 images and sound files can make the body large
+        return await self._submit_async(request, len(image) + len(sound_file or ""))
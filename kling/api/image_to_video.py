@@ -1,13 +1,14 @@
 """Image to Video API - Handles single and multi-image to video."""
 
-from typing import Optional, List, Union
-from kling.base import BaseAPIClient
+import asyncio
+from typing import Dict, Optional, List, Tuple, Union
+from kling.base import BaseAPIClient, _TaskStatusCache, _dump_json, _task_from_response
 from kling.models.video import (
     ImageToVideoRequest,
     MultiImageToVideoRequest,
     ImageInput,
 )
-from kling.models.common import TaskResponse, APIResponse
+from kling.models.common import TaskResponse, APIResponse, TaskListAPIResponse
 
 
 class ImageToVideoAPI:
@@ -26,12 +27,17 @@ class ImageToVideoAPI:
         self.client = client
         self.single_endpoint = "/v1/videos/image2video"
         self.multi_endpoint = "/v1/videos/multi-image2video"
+        # Status URL prefixes, indexed by the ``multi_image`` flag
+        self._get_prefixes = (self.single_endpoint + "/", self.multi_endpoint + "/")
+        self._status_caches = (_TaskStatusCache(), _TaskStatusCache())
 
     def create(
         self,
         image: Optional[str] = None,
-        images: Optional[List[Union[str, dict, ImageInput]]] = None,
-        image_list: Optional[List[Union[str, dict, ImageInput]]] = None,
+        images: Optional[List[Union[str, ImageInput]]] = None,
+        image_list: Optional[List[Union[str, ImageInput]]] = None,
+        *,
+        request: Optional[Union[ImageToVideoRequest, MultiImageToVideoRequest]] = None,
         **kwargs,
     ) -> TaskResponse:
         """Create an image-to-video task.
@@ -42,6 +48,7 @@ class ImageToVideoAPI:
             image: Single image URL or Base64 (for single image mode)
             images: Multiple images (for multi-image mode)
             image_list: Multiple images (alternative parameter name)
+            request: Prebuilt request model, sent as-is without revalidation
             **kwargs: Additional parameters
 
         Returns:
@@ -61,91 +68,43 @@ class ImageToVideoAPI:
             ...     prompt="Two people meeting"
             ... )
         """
-        # Determine if this is single or multi-image
-        multi_images = images or image_list
-
-        if multi_images:
-            # Multi-image mode
-            return self._create_multi_image(images=multi_images, **kwargs)
-        else:
-            # Single image mode
-            return self._create_single_image(image=image, **kwargs)
+        endpoint, request = self._prepare(image, images or image_list, request, kwargs)
+        response = self.client.post(endpoint, content=_dump_json(request))
+        return _task_from_response(response)
 
     async def create_async(
         self,
         image: Optional[str] = None,
-        images: Optional[List[Union[str, dict, ImageInput]]] = None,
-        image_list: Optional[List[Union[str, dict, ImageInput]]] = None,
+        images: Optional[List[Union[str, ImageInput]]] = None,
+        image_list: Optional[List[Union[str, ImageInput]]] = None,
+        *,
+        request: Optional[Union[ImageToVideoRequest, MultiImageToVideoRequest]] = None,
         **kwargs,
     ) -> TaskResponse:
         """Create an image-to-video task asynchronously."""
-        multi_images = images or image_list
-
-        if multi_images:
-            return await self._create_multi_image_async(images=multi_images, **kwargs)
-        else:
-            return await self._create_single_image_async(image=image, **kwargs)
-
-    def _create_single_image(self, **kwargs) -> TaskResponse:
-        """Create single image-to-video task."""
-        request = ImageToVideoRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = self.client.post(self.single_endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    async def _create_single_image_async(self, **kwargs) -> TaskResponse:
-        """Create single image-to-video task asynchronously."""
-        request = ImageToVideoRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = await self.client.post_async(self.single_endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    def _create_multi_image(self, images: List[Union[str, dict, ImageInput]], **kwargs) -> TaskResponse:
-        """Create multi-image-to-video task."""
-        # Normalize images to ImageInput format
-        normalized_images = []
-        for img in images:
-            if isinstance(img, str):
-                normalized_images.append(ImageInput(image=img))
-            elif isinstance(img, dict):
-                normalized_images.append(ImageInput(**img))
-            else:
-                normalized_images.append(img)
-
-        request = MultiImageToVideoRequest(image_list=normalized_images, **kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = self.client.post(self.multi_endpoint, json=data)
-        api_response = APIResponse(**response)
+        endpoint, request = self._prepare(image, images or image_list, request, kwargs)
+        response = await self.client.post_async(endpoint, content=_dump_json(request))
+        return _task_from_response(response)
 
-        return api_response.data
-
-    async def _create_multi_image_async(
-        self, images: List[Union[str, dict, ImageInput]], **kwargs
-    ) -> TaskResponse:
-        """Create multi-image-to-video task asynchronously."""
-        normalized_images = []
-        for img in images:
-            if isinstance(img, str):
-                normalized_images.append(ImageInput(image=img))
-            elif isinstance(img, dict):
-                normalized_images.append(ImageInput(**img))
+    def _prepare(
+        self,
+        image: Optional[str],
+        multi_images: Optional[List[Union[str, ImageInput]]],
+        request: Optional[Union[ImageToVideoRequest, MultiImageToVideoRequest]],
+        kwargs: dict,
+    ) -> Tuple[str, Union[ImageToVideoRequest, MultiImageToVideoRequest]]:
+        """Build the request model if needed and pick the matching endpoint."""
+        if request is None:
+            if multi_images:
+                request = MultiImageToVideoRequest(image_list=multi_images, **kwargs)
             else:
-                normalized_images.append(img)
+                request = ImageToVideoRequest(image=image, **kwargs)
+        elif kwargs or image is not None or multi_images:
+            raise TypeError("Pass either a request model or request parameters, not both")
 
-        request = MultiImageToVideoRequest(image_list=normalized_images, **kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = await self.client.post_async(self.multi_endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
+        if isinstance(request, MultiImageToVideoRequest):
+            return self.multi_endpoint, request
+        return self.single_endpoint, request
 
     def get(self, task_id: str, multi_image: bool = False) -> TaskResponse:
         """Get task status.
@@ -157,21 +116,34 @@ class ImageToVideoAPI:
         Returns:
             Task response with current status
         """
-        endpoint = self.multi_endpoint if multi_image else self.single_endpoint
-        endpoint = f"{endpoint}/{task_id}"
+        return self._get(task_id, multi_image)
 
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
+    def _get(
+        self, task_id: str, multi_image: bool, max_age: Optional[float] = None
+    ) -> TaskResponse:
+        cache = self._status_caches[multi_image]
+        task = cache.get(task_id, max_age)
+        if task is None:
+            endpoint = self._get_prefixes[multi_image] + task_id
+            task = self.client.get_model(endpoint, APIResponse).data
+            cache.put(task_id, task)
 
-        return api_response.data
+        return task
 
     async def get_async(self, task_id: str, multi_image: bool = False) -> TaskResponse:
         """Get task status asynchronously."""
-        endpoint = self.multi_endpoint if multi_image else self.single_endpoint
-        endpoint = f"{endpoint}/{task_id}"
+        return await self._get_async(task_id, multi_image)
+
+    async def _get_async(
+        self, task_id: str, multi_image: bool, max_age: Optional[float] = None
+    ) -> TaskResponse:
+        return await self._status_caches[multi_image].fetch_async(
+            task_id, lambda: self._fetch_async(task_id, multi_image), max_age
+        )
 
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
+    async def _fetch_async(self, task_id: str, multi_image: bool) -> TaskResponse:
+        endpoint = self._get_prefixes[multi_image] + task_id
+        api_response = await self.client.get_model_async(endpoint, APIResponse)
 
         return api_response.data
 
@@ -189,40 +161,44 @@ class ImageToVideoAPI:
             List of task responses
         """
         endpoint = self.multi_endpoint if multi_image else self.single_endpoint
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = self.client.get(endpoint, params=params)
-
-        code = response.get("code", 0)
-        message = response.get("message", "")
-        request_id = response.get("request_id", "")
-
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(message=message, code=code, request_id=request_id)
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
+        params = (("pageNum", page_num), ("pageSize", page_size))
+        api_response = self.client.get_model(endpoint, TaskListAPIResponse, params=params)
+        return api_response.data
 
     async def list_async(
         self, page_num: int = 1, page_size: int = 30, multi_image: bool = False
     ) -> List[TaskResponse]:
         """List image-to-video tasks asynchronously."""
         endpoint = self.multi_endpoint if multi_image else self.single_endpoint
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = await self.client.get_async(endpoint, params=params)
+        params = (("pageNum", page_num), ("pageSize", page_size))
+        api_response = await self.client.get_model_async(
+            endpoint, TaskListAPIResponse, params=params
+        )
+        return api_response.data
 
-        code = response.get("code", 0)
-        message = response.get("message", "")
-        request_id = response.get("request_id", "")
+    async def list_all_async(
+        self, pages: int, page_size: int = 30, multi_image: bool = False
+    ) -> List[TaskResponse]:
+        """List several pages of image-to-video tasks concurrently.
 
-        if code != 0:
-            from kling.exceptions import KlingAPIError
+        The page requests are issued together and multiplexed over the shared
+        HTTP/2 connection.
 
-            raise KlingAPIError(message=message, code=code, request_id=request_id)
+        Args:
+            pages: Number of pages to fetch, starting from page 1
+            page_size: Items per page (1-500)
+            multi_image: Whether to list multi-image tasks
 
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
+        Returns:
+            Tasks from all pages, in page order
+        """
+        results = await asyncio.gather(
+            *[
+                self.list_async(page_num=i, page_size=page_size, multi_image=multi_image)
+                for i in range(1, pages + 1)
+            ]
+        )
+        return [task for page in results for task in page]
 
     def wait_for_completion(
         self,
@@ -230,27 +206,35 @@ class ImageToVideoAPI:
         multi_image: bool = False,
         poll_interval: float = 5.0,
         timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TaskResponse:
         """Wait for task to complete.
 
         Args:
             task_id: Task ID to wait for
             multi_image: Whether this is a multi-image task
-            poll_interval: Seconds between polls (default: 5)
+            poll_interval: Seconds before the first re-poll (default: 5)
             timeout: Maximum wait time in seconds (default: 600)
+            max_poll_interval: Upper bound for the delay between polls (default: 30)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2)
 
         Returns:
             Completed task response
         """
 
+        # Only reuse cached statuses younger than half a poll interval, so the
+        # wait's own polls always reach the server
         def get_task(tid: str) -> TaskResponse:
-            return self.get(tid, multi_image=multi_image)
+            return self._get(tid, multi_image, max_age=poll_interval / 2)
 
         return self.client.wait_for_completion(
             task_id=task_id,
             get_task_func=get_task,
             poll_interval=poll_interval,
             timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
         )
 
     async def wait_for_completion_async(
@@ -259,15 +243,42 @@ class ImageToVideoAPI:
         multi_image: bool = False,
         poll_interval: float = 5.0,
         timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TaskResponse:
         """Wait for task to complete asynchronously."""
 
         async def get_task(tid: str) -> TaskResponse:
-            return await self.get_async(tid, multi_image=multi_image)
+            return await self._get_async(tid, multi_image, max_age=poll_interval / 2)
 
         return await self.client.wait_for_completion_async(
             task_id=task_id,
             get_task_func=get_task,
             poll_interval=poll_interval,
             timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
+        )
+
+    async def wait_for_many_async(
+        self,
+        task_ids: List[str],
+        multi_image: bool = False,
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> Dict[str, TaskResponse]:
+        """Wait for several tasks to complete asynchronously."""
+
+        async def get_task(tid: str) -> TaskResponse:
+            return await self._get_async(tid, multi_image, max_age=poll_interval / 2)
+
+        return await self.client.wait_for_many_async(
+            task_ids,
+            get_task_func=get_task,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
         )
@@ -8,10 +8,14 @@ customization options.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import functools
+import os
 from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
+from pydantic_core import from_json
+
+from ...base import _PollScheduler, _backoff_delays
 
 if TYPE_CHECKING:
     from ...client import KlingClient
@@ -31,6 +35,47 @@ __all__ = [
     'TaskStatus',
 ]
 
+# Raw status strings that end a wait; anything else is still in progress
+_FINAL_STATUS_VALUES = frozenset(
+    getattr(status, 'value', status)
+    for status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+)
+
+
+def _wrap_api_errors(fn):
+    """Translate transport and HTTP errors raised by an API coroutine via handle_api_error.
+
+    Keeps the try/except out of each request method; errors the method has
+    already mapped to a Kling exception pass through unchanged.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except KlingValidationError:
+            raise
+        except Exception as exc:
+            raise handle_api_error(exc) from exc
+
+    return wrapper
+
+
+def _generation_finished(task_id: str, result: VideoGenerationResponse | None) -> bool:
+    """Poll classifier for the shared scheduler; raises for failed or cancelled tasks."""
+    # _poll_task_status returns None for tasks that are still in progress
+    status = getattr(result, "status", None)
+    if status == TaskStatus.COMPLETED:
+        return True
+    if status == TaskStatus.FAILED:
+        error_msg = f"Task {task_id} failed"
+        if getattr(result, "error", None):
+            error_msg += f": {result.error.message}"
+        raise TaskFailedError(error_msg, task_id=task_id)
+    if status == TaskStatus.CANCELLED:
+        raise TaskFailedError(f"Task {task_id} was cancelled", task_id=task_id)
+    return False
+
+
 class ImageToVideoAPI:
     """
     API route client for Kling AI Image-to-Video endpoints.
@@ -46,7 +91,11 @@ class ImageToVideoAPI:
         self._client = client
         self._http = client._client  # httpx.AsyncClient
         self.base_url = client.base_url
+        self._i2v_url = f"{self.base_url}/v1/videos/image2video"
+        self._i2v_prefix = self._i2v_url + "/"
+        self._poller = _PollScheduler(_generation_finished)
 
+    @_wrap_api_errors
     async def create_task(self, request: ImageToVideoRequest) -> VideoGenerationResponse:
         """Create a new image-to-video generation task.
 
@@ -59,17 +108,20 @@ class ImageToVideoAPI:
             APIRequestError: For other API request failures
         """
         try:
-            resp = await self._http.post(f"{self.base_url}/v1/videos/image2video", json=request.model_dump())
+            resp = await self._http.post(
+                self._i2v_url,
+                content=request.model_dump_json(),
+                headers={"Content-Type": "application/json"},
+            )
             resp.raise_for_status()
-            return VideoGenerationResponse(**resp.json())
+            return VideoGenerationResponse.model_validate_json(resp.content)
         except ValidationError as exc:
             raise KlingValidationError(
                 message="Invalid request data",
                 errors=exc.errors(),
             ) from exc
-        except Exception as exc:
-            raise handle_api_error(exc) from exc
 
+    @_wrap_api_errors
     async def get_task_status(self, task_id: str) -> VideoGenerationResponse:
         """Get the status of a video generation task.
 
@@ -81,13 +133,26 @@ class ImageToVideoAPI:
             NotFoundError: If the task doesn't exist
             APIRequestError: For other API request failures
         """
-        try:
-            resp = await self._http.get(f"{self.base_url}/v1/videos/image2video/{task_id}")
-            resp.raise_for_status()
-            return VideoGenerationResponse(**resp.json())
-        except Exception as exc:
-            raise handle_api_error(exc) from exc
+        resp = await self._http.get(self._i2v_prefix + task_id)
+        resp.raise_for_status()
+        return VideoGenerationResponse.model_validate_json(resp.content)
 
+    @_wrap_api_errors
+    async def _poll_task_status(self, task_id: str) -> VideoGenerationResponse | None:
+        """Fetch a task for the poll scheduler, or None while it is still running.
+
+        Only the raw ``status`` is read for unfinished tasks; the full response
+        model is validated once the task reaches a final state.
+        """
+        resp = await self._http.get(self._i2v_prefix + task_id)
+        resp.raise_for_status()
+        raw = from_json(resp.content)
+        status = raw.get('status') if isinstance(raw, dict) else None
+        if status is not None and status not in _FINAL_STATUS_VALUES:
+            return None
+        return VideoGenerationResponse.model_validate(raw)
+
+    @_wrap_api_errors
     async def list_tasks(self, limit: int = 10, offset: int = 0, status: TaskStatus | None = None) -> TaskListResponse:
         """List all image-to-video tasks with optional filtering.
 
@@ -99,26 +164,33 @@ class ImageToVideoAPI:
             TaskListResponse: Paginated list of tasks
         """
         params = {"limit": limit, "offset": offset, "status": status}
-        try:
-            resp = await self._http.get(f"{self.base_url}/v1/videos/image2video", params=params)
-            resp.raise_for_status()
-            return TaskListResponse(**resp.json())
-        except Exception as exc:
-            raise handle_api_error(exc) from exc
+        resp = await self._http.get(self._i2v_url, params=params)
+        resp.raise_for_status()
+        return TaskListResponse.model_validate_json(resp.content)
 
     async def wait_for_task_completion(
         self,
         task_id: str,
         poll_interval: float = 5.0,
         timeout: float | None = 300.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 1.5,
     ) -> VideoGenerationResponse:
         """
         Wait for a task to complete by polling its status.
 
+        The delay between polls starts at ``poll_interval`` and is multiplied
+        by ``backoff_factor`` after every unfinished poll, up to
+        ``max_poll_interval``, with a little random jitter. Polling runs in a
+        shared scheduler, so concurrent waits on several tasks are fetched
+        together each round and waits on the same task share its polls.
+
         Args:
             task_id: ID of the task to wait for
-            poll_interval: How often to poll for updates (seconds)
+            poll_interval: Initial delay between polls (seconds)
             timeout: Maximum time to wait (seconds), or None for no timeout
+            max_poll_interval: Upper bound for the delay between polls (seconds)
+            backoff_factor: Multiplier applied to the delay after each poll
         Returns:
             VideoGenerationResponse with final task status
         Raises:
@@ -126,49 +198,59 @@ class ImageToVideoAPI:
             TaskFailedError: If the task fails or is cancelled
             APIRequestError: For other API request failures
         """
-        start_time = datetime.utcnow()
-        while True:
-            task = await self.get_task_status(task_id)
-            if task.status == TaskStatus.COMPLETED:
-                return task
-            if task.status == TaskStatus.FAILED:
-                error_msg = f"Task {task_id} failed"
-                if getattr(task, "error", None):
-                    error_msg += f": {task.error.message}"
-                raise TaskFailedError(error_msg, task_id=task_id)
-            if task.status == TaskStatus.CANCELLED:
-                raise TaskFailedError(f"Task {task_id} was cancelled", task_id=task_id)
-            if timeout is not None:
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
-                if elapsed > timeout:
-                    raise TimeoutError(
-                        f"Task {task_id} did not complete within {timeout} seconds"
-                    )
-            await asyncio.sleep(poll_interval)
+        delays = _backoff_delays(max(0.5, poll_interval), max_poll_interval, backoff_factor)
+        future = self._poller.register(task_id, self._poll_task_status, delays)
+        try:
+            # Shielded so one waiter timing out does not cancel the shared future
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Task {task_id} did not complete within {timeout} seconds"
+            ) from None
+        finally:
+            self._poller.release(task_id, future)
 
     async def download_video(
         self,
         video_url: str,
         output_path: str,
-        chunk_size: int = 8192,
+        chunk_size: int = 1 << 20,
     ) -> None:
         """
         Download a video from a URL to a local file.
 
+        The body is streamed in large chunks and written from a worker thread,
+        so disk I/O never blocks the event loop. When the server reports a
+        Content-Length for an unencoded body the file is preallocated up front.
+
         Args:
             video_url: URL of the video to download
             output_path: Local path to save the video
-            chunk_size: Size of chunks to download at once
+            chunk_size: Size of chunks to download at once (default: 1 MiB)
         Raises:
             IOError: If the download fails
         """
         url = str(video_url)
+        loop = asyncio.get_running_loop()
         try:
             async with self._http.stream('GET', url) as response:
                 response.raise_for_status()
-                with open(output_path, 'wb') as f:
+                f = await loop.run_in_executor(None, open, output_path, 'wb')
+                try:
+                    # Content-Length counts encoded bytes; only preallocate when
+                    # the body is written as received
+                    length = response.headers.get('Content-Length')
+                    encoded = response.headers.get('Content-Encoding', 'identity') != 'identity'
+                    if length and not encoded and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, int(length))
+                        except OSError:
+                            pass
                     async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                        f.write(chunk)
+                        await loop.run_in_executor(None, f.write, chunk)
+                    # Drop any preallocated tail the body did not fill
+                    await loop.run_in_executor(None, f.truncate)
+                finally:
+                    await loop.run_in_executor(None, f.close)
         except Exception as exc:
             raise OSError(f"Failed to download video from {url}") from exc
-
@@ -1,23 +1,21 @@
 """Lip Sync API."""
 
-from typing import List
-from kling.base import BaseAPIClient
+from typing import Optional
+from kling.base import TaskEndpoint, _build_request, _dump_json, _response_data
 from kling.models.avatar import (
     IdentifyFaceRequest,
     IdentifyFaceResponse,
     LipSyncRequest,
 )
-from kling.models.common import TaskResponse, APIResponse
+from kling.models.common import TaskResponse
 
 
-class LipSyncAPI:
+class LipSyncAPI(TaskEndpoint):
     """Lip-sync API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        """Initialize the lip-sync API."""
-        self.client = client
-        self.identify_endpoint = "/v1/videos/Identify-face"
-        self.lipsync_endpoint = "/v1/videos/advanced-lip-sync"
+    endpoint = "/v1/videos/advanced-lip-sync"
+    lipsync_endpoint = endpoint
+    identify_endpoint = "/v1/videos/Identify-face"
 
     def identify_faces(self, **kwargs) -> IdentifyFaceResponse:
         """Identify faces in a video.
@@ -35,45 +33,26 @@ class LipSyncAPI:
             ...     print(face.face_id, face.start_time, face.end_time)
         """
         request = IdentifyFaceRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
+        body = _dump_json(request)
 
-        response = self.client.post(self.identify_endpoint, json=data)
+        response = self.client.post(self.identify_endpoint, content=body)
 
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        return IdentifyFaceResponse(**response.get("data", {}))
+        return IdentifyFaceResponse.model_validate(_response_data(response))
 
     async def identify_faces_async(self, **kwargs) -> IdentifyFaceResponse:
         """Identify faces in a video asynchronously."""
         request = IdentifyFaceRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = await self.client.post_async(self.identify_endpoint, json=data)
+        body = _dump_json(request)
 
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
+        response = await self.client.post_async(self.identify_endpoint, content=body)
 
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
+        return IdentifyFaceResponse.model_validate(_response_data(response))
 
-        return IdentifyFaceResponse(**response.get("data", {}))
-
-    def create(self, **kwargs) -> TaskResponse:
+    def create(self, *, request: Optional[LipSyncRequest] = None, **kwargs) -> TaskResponse:
         """Create a lip-sync task.
 
         Args:
+            request: Prebuilt request model, sent as-is without revalidation
             **kwargs: Parameters matching LipSyncRequest model
 
         Returns:
@@ -92,100 +71,10 @@ class LipSyncAPI:
             ...     }]
             ... )
         """
-        request = LipSyncRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = self.client.post(self.lipsync_endpoint, json=data)
-        api_response = APIResponse(**response)
+        return self._submit(_build_request(LipSyncRequest, request, kwargs))
 
-        return api_response.data
-
-    async def create_async(self, **kwargs) -> TaskResponse:
-        """Create a lip-sync task asynchronously."""
-        request = LipSyncRequest(**kwargs)
-        data = request.model_dump(exclude_none=True)
-
-        response = await self.client.post_async(self.lipsync_endpoint, json=data)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    def get(self, task_id: str) -> TaskResponse:
-        """Get task status."""
-        endpoint = f"{self.lipsync_endpoint}/{task_id}"
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    async def get_async(self, task_id: str) -> TaskResponse:
-        """Get task status asynchronously."""
-        endpoint = f"{self.lipsync_endpoint}/{task_id}"
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
-
-        return api_response.data
-
-    def list(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        """List lip-sync tasks."""
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = self.client.get(self.lipsync_endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    async def list_async(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        """List lip-sync tasks asynchronously."""
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = await self.client.get_async(self.lipsync_endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    def wait_for_completion(
-        self,
-        task_id: str,
-        poll_interval: float = 5.0,
-        timeout: float = 600.0,
+    async def create_async(
+        self, *, request: Optional[LipSyncRequest] = None, **kwargs
     ) -> TaskResponse:
-        """Wait for task to complete."""
-        return self.client.wait_for_completion(
-            task_id=task_id,
-            get_task_func=self.get,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
-
-    async def wait_for_completion_async(
-        self,
-        task_id: str,
-        poll_interval: float = 5.0,
-        timeout: float = 600.0,
-    ) -> TaskResponse:
-        """Wait for task to complete asynchronously."""
-        return await self.client.wait_for_completion_async(
-            task_id=task_id,
-            get_task_func=self.get_async,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
+        """Create a lip-sync task asynchronously."""
+        return await self._submit_async(_build_request(LipSyncRequest, request, kwargs))
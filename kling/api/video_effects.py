@@ -1,19 +1,52 @@
 """Video Effects API."""
 
-from typing import List
-from kling.base import BaseAPIClient
-from kling.models.effects import VideoEffectsRequest
-from kling.models.common import TaskResponse, APIResponse
-
-
-class VideoEffectsAPI:
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from kling.base import TaskEndpoint
+from kling.models.effects import (
+    DUAL_CHARACTER_EFFECT_SCENES,
+    SINGLE_IMAGE_EFFECT_SCENES,
+    DualCharacterEffectInput,
+    SingleImageEffectInput,
+    VideoEffectsRequest,
+)
+from kling.models.common import TaskResponse
+
+
+def _build_effects_request(
+    effect_scene: str, input: Dict[str, Any], kwargs: Dict[str, Any]
+) -> VideoEffectsRequest:
+    """Build a request, validating ``input`` against the model its scene is known to use.
+
+    Handing ``VideoEffectsRequest`` an already-built input model lets it skip
+    trying each branch of its ``input`` union. Unknown scenes, and inputs that
+    do not fit the expected model, go through the generic union as before.
+    """
+    effect_input: Union[SingleImageEffectInput, DualCharacterEffectInput, Dict[str, Any]] = input
+    if isinstance(input, dict):
+        input_model: Optional[Type[BaseModel]]
+        if effect_scene in SINGLE_IMAGE_EFFECT_SCENES:
+            input_model = SingleImageEffectInput
+        elif effect_scene in DUAL_CHARACTER_EFFECT_SCENES:
+            input_model = DualCharacterEffectInput
+        else:
+            input_model = None
+        if input_model is not None:
+            try:
+                effect_input = input_model.model_validate(input)
+            except ValidationError:
+                pass
+    return VideoEffectsRequest(effect_scene=effect_scene, input=effect_input, **kwargs)
+
+
+class VideoEffectsAPI(TaskEndpoint):
     """Video effects API client."""
 
-    def __init__(self, client: BaseAPIClient):
-        self.client = client
-        self.endpoint = "/v1/videos/effects"
+    endpoint = "/v1/videos/effects"
 
-    def create(self, effect_scene: str, input: dict, **kwargs) -> TaskResponse:
+    def create(self, effect_scene: str, input: Dict[str, Any], **kwargs: Any) -> TaskResponse:
         """Create a video effects task.
 
         Args:
@@ -41,78 +74,9 @@ class VideoEffectsAPI:
             ...     }
             ... )
         """
-        request = VideoEffectsRequest(effect_scene=effect_scene, input=input, **kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = self.client.post(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def create_async(self, effect_scene: str, input: dict, **kwargs) -> TaskResponse:
-        request = VideoEffectsRequest(effect_scene=effect_scene, input=input, **kwargs)
-        data = request.model_dump(exclude_none=True)
-        response = await self.client.post_async(self.endpoint, json=data)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def get(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = self.client.get(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    async def get_async(self, task_id: str) -> TaskResponse:
-        endpoint = f"{self.endpoint}/{task_id}"
-        response = await self.client.get_async(endpoint)
-        api_response = APIResponse(**response)
-        return api_response.data
-
-    def list(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = self.client.get(self.endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    async def list_async(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
-        params = {"pageNum": page_num, "pageSize": page_size}
-        response = await self.client.get_async(self.endpoint, params=params)
-
-        code = response.get("code", 0)
-        if code != 0:
-            from kling.exceptions import KlingAPIError
-
-            raise KlingAPIError(
-                message=response.get("message", ""),
-                code=code,
-                request_id=response.get("request_id", ""),
-            )
-
-        data = response.get("data", [])
-        return [TaskResponse(**item) for item in data]
-
-    def wait_for_completion(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
-    ) -> TaskResponse:
-        return self.client.wait_for_completion(
-            task_id=task_id, get_task_func=self.get, poll_interval=poll_interval, timeout=timeout
-        )
+        return self._submit(_build_effects_request(effect_scene, input, kwargs))
 
-    async def wait_for_completion_async(
-        self, task_id: str, poll_interval: float = 5.0, timeout: float = 600.0
+    async def create_async(
+        self, effect_scene: str, input: Dict[str, Any], **kwargs: Any
     ) -> TaskResponse:
-        return await self.client.wait_for_completion_async(
-            task_id=task_id,
-            get_task_func=self.get_async,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
+        return await self._submit_async(_build_effects_request(effect_scene, input, kwargs))
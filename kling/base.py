@@ -1,11 +1,372 @@
 """Base API client with authentication and polling logic."""
 
+import asyncio
+import random
 import time
 import jwt
-from typing import Optional, Dict, Any, Callable
+from contextlib import asynccontextmanager
+from functools import partial
+from urllib.request import getproxies
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 import httpx
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 from kling.exceptions import KlingAPIError, KlingTimeoutError
-from kling.models.common import APIResponse, TaskResponse, TaskStatus
+from kling.models.common import TaskListAPIResponse, TaskResponse, TaskStatus
+
+# Query parameters may be passed as key/value pairs, which httpx encodes without
+# building an intermediate dict
+_QueryParams = Union[Dict[str, Any], Sequence[Tuple[str, Any]]]
+
+RequestModelT = TypeVar("RequestModelT", bound=BaseModel)
+ResponseModelT = TypeVar("ResponseModelT", bound=BaseModel)
+
+# Signed tokens are valid for 30 minutes and reused across requests until
+# shortly before they expire.
+_JWT_TTL = 1800
+_JWT_REFRESH_MARGIN = 60
+
+# Idle connections are kept longer than the largest gap between task polls
+# (max_poll_interval defaults to 30s), so waits reuse the open TLS connection
+# instead of reconnecting on every poll.
+_KEEPALIVE_EXPIRY = 60.0
+
+# Concurrent create_async/get_async calls to the same host are multiplexed as
+# HTTP/2 streams over a small number of pooled connections.
+_ASYNC_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=64, max_connections=128, keepalive_expiry=_KEEPALIVE_EXPIRY
+)
+_SYNC_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=_KEEPALIVE_EXPIRY
+)
+
+# Tasks that are polled once and then abandoned never reach a terminal status,
+# so the per-endpoint ETag cache keeps only the most recently polled tasks.
+_ETAG_CACHE_MAXSIZE = 1024
+
+
+def _backoff_delays(
+    initial: float, cap: float, factor: float = 2.0, jitter: float = 0.2
+) -> Iterator[float]:
+    """Yield truncated exponential poll delays with +/- ``jitter`` randomization."""
+    delay = initial
+    cap = max(cap, initial)
+    while True:
+        yield delay * random.uniform(1.0 - jitter, 1.0 + jitter)
+        delay = min(cap, delay * factor)
+
+
+# Request bodies estimated above this many bytes (typically Base64 media) are
+# serialized in a worker thread so the event loop keeps serving other tasks.
+_OFFLOAD_SERIALIZE_BYTES = 4096
+
+
+def _dump_json(request: BaseModel) -> bytes:
+    """Serialize a request model to JSON bytes, leaving out unset optional fields.
+
+    Calls the model's compiled serializer directly: it drops None values in
+    pydantic-core and returns bytes, skipping model_dump_json's Python-level
+    argument handling and the str-to-bytes re-encode in httpx.
+    """
+    return request.__pydantic_serializer__.to_json(request, exclude_none=True)
+
+
+async def _dump_json_async(request: BaseModel, size_hint: int) -> bytes:
+    """Serialize a request model, off the event loop when it is large."""
+    if size_hint <= _OFFLOAD_SERIALIZE_BYTES:
+        return _dump_json(request)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _dump_json, request)
+
+
+def _build_request(
+    model: Type[RequestModelT], request: Optional[RequestModelT], kwargs: Dict[str, Any]
+) -> RequestModelT:
+    """Return a prebuilt ``request`` as-is, or validate ``kwargs`` into ``model``."""
+    if request is None:
+        return model(**kwargs)
+    if kwargs:
+        raise TypeError("Pass either a request model or request parameters, not both")
+    if not isinstance(request, model):
+        raise TypeError(f"request must be a {model.__name__}, got {type(request).__name__}")
+    return request
+
+
+def _response_data(response: Dict[str, Any]) -> Any:
+    """Return the ``data`` payload of a response envelope, raising if it is missing."""
+    data = response.get("data")
+    if data is None:
+        raise KlingAPIError(
+            message=f"Response has no data: {response.get('message') or 'no message'}",
+            code=-1,
+            request_id=response.get("request_id", ""),
+        )
+    return data
+
+
+def _task_from_response(response: Dict[str, Any]) -> TaskResponse:
+    """Validate the task in a decoded, already error-checked response envelope.
+
+    The envelope fields were checked by :func:`_raise_if_error`, so only the
+    ``data`` payload goes through pydantic.
+    """
+    return TaskResponse.model_validate(_response_data(response))
+
+
+def _raise_if_error(response: Dict[str, Any]) -> None:
+    """Raise KlingAPIError if a decoded response envelope reports a non-zero code."""
+    code = response.get("code", 0)
+    if code:
+        raise KlingAPIError(
+            message=response.get("message", "Unknown error"),
+            code=code,
+            request_id=response.get("request_id", ""),
+        )
+
+
+def _store_task_etag(
+    cache: Dict[str, Tuple[str, TaskResponse]],
+    task_id: str,
+    etag: Optional[str],
+    task: TaskResponse,
+    maxsize: int = _ETAG_CACHE_MAXSIZE,
+) -> None:
+    """Remember a task response by ETag while it can still change.
+
+    The least recently stored task is evicted once ``maxsize`` tasks are cached.
+    """
+    cache.pop(task_id, None)
+    if etag and task.task_status not in ("succeed", "failed"):
+        if len(cache) >= maxsize:
+            del cache[next(iter(cache))]
+        cache[task_id] = (etag, task)
+
+
+class _TaskStatusCache:
+    """Short-lived cache of task status responses.
+
+    Repeated status requests for the same task within ``ttl`` seconds are
+    served from memory, and concurrent async requests for a task that is not
+    cached share a single in-flight fetch. Callers polling on a shorter
+    interval pass a smaller ``max_age`` so they never see a stale status.
+    Tasks that have succeeded or failed can no longer change, so they stay
+    cached until evicted.
+    """
+
+    def __init__(self, ttl: float = 2.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # task_id -> (fetch time, response)
+        self._entries: Dict[str, Tuple[float, TaskResponse]] = {}
+        self._inflight: "Dict[str, asyncio.Future[TaskResponse]]" = {}
+        self._inflight_refs: Dict[str, int] = {}
+
+    def get(self, task_id: str, max_age: Optional[float] = None) -> Optional[TaskResponse]:
+        """Return the cached response for a task if it is at most ``max_age`` old."""
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        fetched_at, task = entry
+        if task.task_status in ("succeed", "failed"):
+            return task
+        age = time.monotonic() - fetched_at
+        if age >= self.ttl:
+            del self._entries[task_id]
+            return None
+        if max_age is not None and age >= max_age:
+            return None
+        return task
+
+    def put(self, task_id: str, task: TaskResponse) -> None:
+        """Store a task response, evicting the oldest entry when full."""
+        self._entries.pop(task_id, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[task_id] = (time.monotonic(), task)
+
+    async def fetch_async(
+        self,
+        task_id: str,
+        fetch: Callable[[], Awaitable[TaskResponse]],
+        max_age: Optional[float] = None,
+    ) -> TaskResponse:
+        """Return the cached response or run ``fetch``, sharing concurrent fetches."""
+        cached = self.get(task_id, max_age)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(task_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(fetch())
+            self._inflight[task_id] = inflight
+            inflight.add_done_callback(lambda fut: self._fetched(task_id, fut))
+        self._inflight_refs[task_id] = self._inflight_refs.get(task_id, 0) + 1
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Abort the request once the last caller sharing it has gone away
+            if self._inflight_refs[task_id] == 1:
+                inflight.cancel()
+            raise
+        finally:
+            self._inflight_refs[task_id] -= 1
+            if not self._inflight_refs[task_id]:
+                del self._inflight_refs[task_id]
+
+    def _fetched(self, task_id: str, future: "asyncio.Future[TaskResponse]") -> None:
+        if self._inflight.get(task_id) is future:
+            del self._inflight[task_id]
+        if not future.cancelled() and future.exception() is None:
+            self.put(task_id, future.result())
+
+
+def _task_finished(task_id: str, task: TaskResponse) -> bool:
+    """Default poll classifier: True once a task succeeded, raising if it failed."""
+    if task.task_status == "succeed":
+        return True
+    if task.task_status == "failed":
+        raise KlingAPIError(
+            message=task.task_status_msg or "Task failed",
+            code=-1,
+            request_id="",
+        )
+    return False
+
+
+class _PollWaiter:
+    """A task registered with the poll scheduler."""
+
+    def __init__(
+        self,
+        get_task_func: Callable[[str], Any],
+        delays: Iterator[float],
+        future: "asyncio.Future[TaskResponse]",
+    ):
+        self.get_task_func = get_task_func
+        self.delays = delays
+        self.future = future
+        self.next_poll = 0.0
+        self.refs = 0
+        # Status request currently in flight for this task, if any
+        self.poll: "Optional[asyncio.Future[TaskResponse]]" = None
+
+
+class _PollScheduler:
+    """Polls every pending async wait from a single coroutine.
+
+    Each tick starts the status requests for all task IDs that are due, then
+    sleeps until the next waiter is due. Every poll resolves its own waiter
+    as soon as it returns, independently of the others. Every waiter backs
+    off exponentially on its own schedule, and waiters on the same task ID
+    share one status request.
+
+    ``is_finished(task_id, result)`` decides what a poll result means: it
+    returns True to resolve the wait with the result, False to poll again,
+    or raises to fail the wait with that exception.
+    """
+
+    def __init__(self, is_finished: Callable[[str, Any], bool] = _task_finished) -> None:
+        self._is_finished = is_finished
+        self._waiters: Dict[str, _PollWaiter] = {}
+        self._runner: "Optional[asyncio.Task[None]]" = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def register(
+        self, task_id: str, get_task_func: Callable[[str], Any], delays: Iterator[float]
+    ) -> "asyncio.Future[TaskResponse]":
+        """Register a task and return a future resolved when it finishes."""
+        waiter = self._waiters.get(task_id)
+        if waiter is None:
+            future = asyncio.get_running_loop().create_future()
+            waiter = _PollWaiter(get_task_func, delays, future)
+            self._waiters[task_id] = waiter
+        waiter.refs += 1
+
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.ensure_future(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+        return waiter.future
+
+    def release(self, task_id: str, future: "asyncio.Future[TaskResponse]") -> None:
+        """Drop one reference to a task, forgetting it once nobody waits on it."""
+        waiter = self._waiters.get(task_id)
+        if waiter is None or waiter.future is not future:
+            return
+        waiter.refs -= 1
+        if waiter.refs <= 0:
+            del self._waiters[task_id]
+            waiter.future.cancel()
+            if waiter.poll is not None:
+                waiter.poll.cancel()
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeup
+        assert wakeup is not None
+
+        while self._waiters:
+            # Start every due poll; each resolves its own waiter on completion,
+            # so a slow status request never holds up the other waiters
+            now = loop.time()
+            for task_id, waiter in self._waiters.items():
+                if waiter.poll is None and waiter.next_poll <= now:
+                    waiter.poll = asyncio.ensure_future(waiter.get_task_func(task_id))
+                    waiter.poll.add_done_callback(partial(self._poll_done, task_id, waiter))
+
+            # Sleep until the next idle waiter is due, or until a poll finishes
+            # or a waiter registers or leaves
+            idle = [w.next_poll for w in self._waiters.values() if w.poll is None]
+            delay = max(0.0, min(idle) - loop.time()) if idle else None
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _poll_done(
+        self, task_id: str, waiter: _PollWaiter, poll: "asyncio.Future[TaskResponse]"
+    ) -> None:
+        waiter.poll = None
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if waiter.future.done():
+            return
+
+        if poll.cancelled():
+            waiter.future.cancel()
+        elif poll.exception() is not None:
+            waiter.future.set_exception(poll.exception())
+        else:
+            result = poll.result()
+            try:
+                finished = self._is_finished(task_id, result)
+            except Exception as exc:
+                waiter.future.set_exception(exc)
+            else:
+                if not finished:
+                    waiter.next_poll = asyncio.get_running_loop().time() + next(waiter.delays)
+                    return
+                waiter.future.set_result(result)
+        if self._waiters.get(task_id) is waiter:
+            del self._waiters[task_id]
 
 
 class BaseAPIClient:
@@ -18,6 +379,7 @@ class BaseAPIClient:
         base_url: str = "https://api-singapore.klingai.com",
         timeout: float = 30.0,
         max_retries: int = 3,
+        max_concurrency: int = 16,
     ):
         """Initialize the base API client.
 
@@ -26,40 +388,120 @@ class BaseAPIClient:
             secret_key: Kling AI Secret Key
             base_url: Base URL for the API
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of connection retry attempts
+            max_concurrency: Maximum number of async requests in flight at once
         """
         self.access_key = access_key
         self.secret_key = secret_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+
+        # Async request limiter, created on first use inside the event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._peak_in_flight = 0
 
-        # Create HTTP clients
-        self._client = httpx.Client(timeout=timeout)
-        self._async_client = httpx.AsyncClient(timeout=timeout)
+        # Cached "Bearer <jwt>" header value and when to re-sign it
+        self._auth_header: Optional[str] = None
+        self._auth_refresh_at = 0.0
+
+        # Create HTTP clients. All of them negotiate HTTP/2 where the server
+        # offers it and share one SSL context, so the CA bundle is loaded once.
+        self._ssl_context = httpx.create_ssl_context()
+        self._client = self._make_client(httpx.Client, httpx.HTTPTransport, _SYNC_POOL_LIMITS)
+        self._async_client = self._make_client(
+            httpx.AsyncClient, httpx.AsyncHTTPTransport, _ASYNC_POOL_LIMITS
+        )
+        # Async GETs (status polls and list pages) use their own connection so
+        # they are not queued behind large Base64 uploads on the POST connection.
+        self._async_poll_client = self._make_client(
+            httpx.AsyncClient, httpx.AsyncHTTPTransport, _ASYNC_POOL_LIMITS
+        )
+        self._poll_scheduler = _PollScheduler()
+
+    def _make_client(self, client_cls: Any, transport_cls: Any, limits: httpx.Limits) -> Any:
+        """Build an httpx client that retries failed connection attempts.
+
+        Passing a transport stops httpx from reading HTTP(S)_PROXY, ALL_PROXY
+        and NO_PROXY, so when a proxy is configured the options go to the
+        client instead and httpx sets up its proxy transports as usual (without
+        connection retries).
+        """
+        options: Dict[str, Any] = {"verify": self._ssl_context, "http2": True, "limits": limits}
+        if any(scheme != "no" for scheme in getproxies()):
+            return client_cls(timeout=self.timeout, **options)
+        return client_cls(
+            timeout=self.timeout, transport=transport_cls(retries=self.max_retries, **options)
+        )
 
     def _generate_jwt_token(self) -> str:
         """Generate JWT token for API authentication."""
         now = int(time.time())
         payload = {
             "iss": self.access_key,
-            "exp": now + 1800,  # Token expires in 30 minutes
+            "exp": now + _JWT_TTL,  # Token expires in 30 minutes
             "nbf": now - 5,  # Token valid from 5 seconds ago
         }
         return jwt.encode(payload, self.secret_key, algorithm="HS256")
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication."""
-        token = self._generate_jwt_token()
+        """Get request headers with authentication.
+
+        The JWT is signed once and reused until it is close to expiry, rather
+        than re-signed for every request.
+        """
+        now = time.time()
+        if self._auth_header is None or now >= self._auth_refresh_at:
+            self._auth_header = f"Bearer {self._generate_jwt_token()}"
+            self._auth_refresh_at = now + _JWT_TTL - _JWT_REFRESH_MARGIN
         return {
-            "Authorization": f"Bearer {token}",
+            "Authorization": self._auth_header,
             "Content-Type": "application/json",
         }
 
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``max_concurrency`` async request slots."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        semaphore = self._semaphore
+
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+
+    @property
+    def concurrency_stats(self) -> Dict[str, int]:
+        """Async request limiter counters, useful for tuning ``max_concurrency``."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle API response and raise errors if needed."""
         try:
-            data = response.json()
+            # pydantic-core's parser is markedly faster than httpx's json.loads
+            # on these small envelopes and is already a dependency
+            data = from_json(response.content)
         except Exception:
             raise KlingAPIError(
                 message="Invalid JSON response from API",
@@ -67,47 +509,77 @@ class BaseAPIClient:
                 request_id="",
             )
 
-        # Check for API errors
-        if data.get("code", 0) != 0:
+        _raise_if_error(data)
+        return data
+
+    def _handle_model_response(
+        self, response: httpx.Response, model: Type[ResponseModelT]
+    ) -> ResponseModelT:
+        """Validate a response body straight into ``model`` and raise on API errors.
+
+        Decoding and validation happen in a single pydantic-core pass. Bodies
+        that do not fit the model (typically error envelopes) are routed through
+        :meth:`_handle_response` so API errors still surface as KlingAPIError.
+        """
+        try:
+            envelope = model.model_validate_json(response.content)
+        except ValidationError:
+            self._handle_response(response)
+            raise
+        if envelope.code != 0:
             raise KlingAPIError(
-                message=data.get("message", "Unknown error"),
-                code=data.get("code", -1),
-                request_id=data.get("request_id", ""),
+                message=envelope.message,
+                code=envelope.code,
+                request_id=envelope.request_id,
             )
+        return envelope
 
-        return data
-
-    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def post(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
+    ) -> Dict[str, Any]:
         """Make a POST request.
 
         Args:
             endpoint: API endpoint (e.g., "/v1/videos/text2video")
             json: Request body as dictionary
+            content: Pre-encoded JSON request body, used instead of ``json``
 
         Returns:
             Response data as dictionary
         """
         url = f"{self.base_url}{endpoint}"
-        response = self._client.post(url, headers=self._get_headers(), json=json)
+        response = self._client.post(
+            url, headers=self._get_headers(), json=json, content=content
+        )
         return self._handle_response(response)
 
     async def post_async(
-        self, endpoint: str, json: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
     ) -> Dict[str, Any]:
         """Make an async POST request.
 
         Args:
             endpoint: API endpoint
             json: Request body as dictionary
+            content: Pre-encoded JSON request body, used instead of ``json``
 
         Returns:
             Response data as dictionary
         """
         url = f"{self.base_url}{endpoint}"
-        response = await self._async_client.post(url, headers=self._get_headers(), json=json)
+        async with self._request_slot():
+            response = await self._async_client.post(
+                url, headers=self._get_headers(), json=json, content=content
+            )
         return self._handle_response(response)
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def get(self, endpoint: str, params: Optional[_QueryParams] = None) -> Dict[str, Any]:
         """Make a GET request.
 
         Args:
@@ -122,7 +594,7 @@ class BaseAPIClient:
         return self._handle_response(response)
 
     async def get_async(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self, endpoint: str, params: Optional[_QueryParams] = None
     ) -> Dict[str, Any]:
         """Make an async GET request.
 
@@ -134,23 +606,133 @@ class BaseAPIClient:
             Response data as dictionary
         """
         url = f"{self.base_url}{endpoint}"
-        response = await self._async_client.get(url, headers=self._get_headers(), params=params)
+        async with self._request_slot():
+            response = await self._async_poll_client.get(
+                url, headers=self._get_headers(), params=params
+            )
         return self._handle_response(response)
 
+    def get_model(
+        self,
+        endpoint: str,
+        model: Type[ResponseModelT],
+        params: Optional[_QueryParams] = None,
+    ) -> ResponseModelT:
+        """Make a GET request and validate the response envelope as ``model``.
+
+        Args:
+            endpoint: API endpoint
+            model: Response envelope model (with code, message and request_id)
+            params: Query parameters
+
+        Returns:
+            Validated response envelope
+        """
+        url = f"{self.base_url}{endpoint}"
+        response = self._client.get(url, headers=self._get_headers(), params=params)
+        return self._handle_model_response(response, model)
+
+    async def get_model_async(
+        self,
+        endpoint: str,
+        model: Type[ResponseModelT],
+        params: Optional[_QueryParams] = None,
+    ) -> ResponseModelT:
+        """Make an async GET request and validate the response envelope as ``model``.
+
+        Args:
+            endpoint: API endpoint
+            model: Response envelope model (with code, message and request_id)
+            params: Query parameters
+
+        Returns:
+            Validated response envelope
+        """
+        url = f"{self.base_url}{endpoint}"
+        async with self._request_slot():
+            response = await self._async_poll_client.get(
+                url, headers=self._get_headers(), params=params
+            )
+        return self._handle_model_response(response, model)
+
+    def get_conditional(
+        self, endpoint: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Make a GET request that sends If-None-Match when an ETag is known.
+
+        Args:
+            endpoint: API endpoint
+            etag: ETag from a previous response for the same endpoint
+
+        Returns:
+            Tuple of (ETag of the response, response data). The data is None
+            when the server answered 304 Not Modified.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = self._get_headers()
+        if etag:
+            headers["If-None-Match"] = etag
+        response = self._client.get(url, headers=headers)
+        if response.status_code == 304:
+            return etag, None
+        return response.headers.get("ETag"), self._handle_response(response)
+
+    async def get_conditional_async(
+        self, endpoint: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Make an async GET request that sends If-None-Match when an ETag is known.
+
+        Args:
+            endpoint: API endpoint
+            etag: ETag from a previous response for the same endpoint
+
+        Returns:
+            Tuple of (ETag of the response, response data). The data is None
+            when the server answered 304 Not Modified.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = self._get_headers()
+        if etag:
+            headers["If-None-Match"] = etag
+        async with self._request_slot():
+            response = await self._async_poll_client.get(url, headers=headers)
+        if response.status_code == 304:
+            return etag, None
+        return response.headers.get("ETag"), self._handle_response(response)
+
+    def warmup(self) -> None:
+        """Open a pooled connection to the API host ahead of the first request."""
+        self._client.head(self.base_url)
+
+    async def warmup_async(self) -> None:
+        """Open pooled async connections to the API host ahead of the first request."""
+        await asyncio.gather(
+            self._async_client.head(self.base_url),
+            self._async_poll_client.head(self.base_url),
+        )
+
     def wait_for_completion(
         self,
         task_id: str,
         get_task_func: Callable[[str], TaskResponse],
         poll_interval: float = 5.0,
         timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TaskResponse:
         """Poll a task until it completes.
 
+        The delay between polls starts at ``poll_interval`` and grows by
+        ``backoff_factor`` after each unfinished poll up to
+        ``max_poll_interval``, with +/-20% jitter.
+
         Args:
             task_id: Task ID to poll
             get_task_func: Function to get task status
-            poll_interval: Seconds between poll attempts
+            poll_interval: Seconds before the first re-poll
             timeout: Maximum seconds to wait
+            max_poll_interval: Upper bound for the delay between polls
+            backoff_factor: Multiplier applied to the delay after each poll
 
         Returns:
             Completed task response
@@ -159,7 +741,8 @@ class BaseAPIClient:
             KlingTimeoutError: If task doesn't complete within timeout
             KlingAPIError: If task fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        delays = _backoff_delays(poll_interval, max_poll_interval, backoff_factor)
 
         while True:
             task = get_task_func(task_id)
@@ -174,14 +757,14 @@ class BaseAPIClient:
                 )
 
             # Check timeout
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed >= timeout:
                 raise KlingTimeoutError(
                     f"Task {task_id} did not complete within {timeout} seconds"
                 )
 
-            # Wait before next poll
-            time.sleep(poll_interval)
+            # Wait before next poll, but not past the deadline
+            time.sleep(min(next(delays), timeout - elapsed))
 
     async def wait_for_completion_async(
         self,
@@ -189,14 +772,22 @@ class BaseAPIClient:
         get_task_func: Callable[[str], Any],
         poll_interval: float = 5.0,
         timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TaskResponse:
         """Async poll a task until it completes.
 
+        Concurrent waits are served by a shared scheduler that polls every
+        due task on the same tick instead of running one loop per task. Poll
+        delays back off exponentially as in :meth:`wait_for_completion`.
+
         Args:
             task_id: Task ID to poll
             get_task_func: Async function to get task status
-            poll_interval: Seconds between poll attempts
+            poll_interval: Seconds before the first re-poll
             timeout: Maximum seconds to wait
+            max_poll_interval: Upper bound for the delay between polls
+            backoff_factor: Multiplier applied to the delay after each poll
 
         Returns:
             Completed task response
@@ -205,39 +796,80 @@ class BaseAPIClient:
             KlingTimeoutError: If task doesn't complete within timeout
             KlingAPIError: If task fails
         """
-        import asyncio
+        delays = _backoff_delays(poll_interval, max_poll_interval, backoff_factor)
+        future = self._poll_scheduler.register(task_id, get_task_func, delays)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise KlingTimeoutError(
+                f"Task {task_id} did not complete within {timeout} seconds"
+            )
+        finally:
+            self._poll_scheduler.release(task_id, future)
 
-        start_time = time.time()
+    async def wait_for_many_async(
+        self,
+        task_ids: Sequence[str],
+        get_task_func: Callable[[str], Any],
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> Dict[str, TaskResponse]:
+        """Async poll several tasks until all of them complete.
 
-        while True:
-            task = await get_task_func(task_id)
+        The tasks are registered with the shared poll scheduler together, so
+        each tick fetches every due task concurrently rather than running one
+        poll loop per task. Status requests go through the client's
+        concurrency limit like any other request.
 
-            if task.task_status == "succeed":
-                return task
-            elif task.task_status == "failed":
-                raise KlingAPIError(
-                    message=task.task_status_msg or "Task failed",
-                    code=-1,
-                    request_id="",
-                )
+        Args:
+            task_ids: Task IDs to poll
+            get_task_func: Async function to get task status
+            poll_interval: Seconds before the first re-poll
+            timeout: Maximum seconds to wait for all tasks
+            max_poll_interval: Upper bound for the delay between polls
+            backoff_factor: Multiplier applied to the delay after each poll
 
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise KlingTimeoutError(
-                    f"Task {task_id} did not complete within {timeout} seconds"
-                )
+        Returns:
+            Completed task responses keyed by task ID
 
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
+        Raises:
+            KlingTimeoutError: If any task doesn't complete within timeout
+            KlingAPIError: If any task fails
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        waits = [
+            asyncio.ensure_future(
+                self.wait_for_completion_async(
+                    task_id,
+                    get_task_func,
+                    poll_interval=poll_interval,
+                    timeout=timeout,
+                    max_poll_interval=max_poll_interval,
+                    backoff_factor=backoff_factor,
+                )
+            )
+            for task_id in unique_ids
+        ]
+        try:
+            tasks = await asyncio.gather(*waits)
+        finally:
+            # On the first failure, stop the remaining waits so their tasks are
+            # released from the poll scheduler instead of polling until timeout
+            for wait in waits:
+                wait.cancel()
+            await asyncio.gather(*waits, return_exceptions=True)
+        return dict(zip(unique_ids, tasks))
 
     def close(self):
         """Close HTTP clients."""
         self._client.close()
 
     async def close_async(self):
-        """Close async HTTP client."""
+        """Close async HTTP clients."""
         await self._async_client.aclose()
+        await self._async_poll_client.aclose()
 
     def __enter__(self):
         """Context manager entry."""
@@ -254,3 +886,253 @@ class BaseAPIClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close_async()
+
+
+class Endpoint:
+    """Shared request submission for an API endpoint.
+
+    Subclasses set ``endpoint`` and expose typed ``create``/``create_async``
+    methods that build their request model and hand it to :meth:`_submit`.
+    """
+
+    endpoint: str = ""
+
+    def __init__(self, client: BaseAPIClient):
+        """Initialize the endpoint.
+
+        Args:
+            client: Base API client instance
+        """
+        self.client = client
+
+    def _submit(self, request: BaseModel) -> TaskResponse:
+        """POST a request model to the endpoint and return the created task."""
+        body = _dump_json(request)
+        response = self.client.post(self.endpoint, content=body)
+        return _task_from_response(response)
+
+    async def _submit_async(self, request: BaseModel, size_hint: int = 0) -> TaskResponse:
+        """POST a request model asynchronously and return the created task.
+
+        Args:
+            request: Validated request model
+            size_hint: Estimated body size in bytes, used to decide whether
+                serialization runs off the event loop
+        """
+        body = await _dump_json_async(request, size_hint)
+        response = await self.client.post_async(self.endpoint, content=body)
+        return _task_from_response(response)
+
+
+class TaskEndpoint(Endpoint):
+    """Endpoint whose tasks can be queried and polled until completion.
+
+    Status requests go through a short-lived cache that also coalesces
+    concurrent async lookups, and reuse unchanged responses via ETags.
+    """
+
+    def __init__(self, client: BaseAPIClient):
+        """Initialize the endpoint.
+
+        Args:
+            client: Base API client instance
+        """
+        super().__init__(client)
+        self._get_prefix = self.endpoint + "/"
+        self._task_cache: Dict[str, Tuple[str, TaskResponse]] = {}
+        self._status_cache = _TaskStatusCache()
+
+    def get(self, task_id: str) -> TaskResponse:
+        """Get task status.
+
+        Args:
+            task_id: Task ID or external_task_id
+
+        Returns:
+            Task response with current status
+        """
+        return self._get(task_id)
+
+    def _get(self, task_id: str, max_age: Optional[float] = None) -> TaskResponse:
+        task = self._status_cache.get(task_id, max_age)
+        if task is not None:
+            return task
+
+        endpoint = self._get_prefix + task_id
+        etag, cached = self._task_cache.get(task_id, (None, None))
+        etag, response = self.client.get_conditional(endpoint, etag)
+        task = cached if response is None else _task_from_response(response)
+        _store_task_etag(self._task_cache, task_id, etag, task)
+        self._status_cache.put(task_id, task)
+        return task
+
+    async def get_async(self, task_id: str) -> TaskResponse:
+        """Get task status asynchronously.
+
+        Args:
+            task_id: Task ID or external_task_id
+
+        Returns:
+            Task response with current status
+        """
+        return await self._get_async(task_id)
+
+    async def _get_async(self, task_id: str, max_age: Optional[float] = None) -> TaskResponse:
+        return await self._status_cache.fetch_async(
+            task_id, lambda: self._fetch_async(task_id), max_age
+        )
+
+    async def _fetch_async(self, task_id: str) -> TaskResponse:
+        endpoint = self._get_prefix + task_id
+        etag, cached = self._task_cache.get(task_id, (None, None))
+        etag, response = await self.client.get_conditional_async(endpoint, etag)
+        task = cached if response is None else _task_from_response(response)
+        _store_task_etag(self._task_cache, task_id, etag, task)
+        return task
+
+    def list(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
+        """List tasks.
+
+        Args:
+            page_num: Page number (1-1000)
+            page_size: Items per page (1-500)
+
+        Returns:
+            List of task responses
+        """
+        params = (("pageNum", page_num), ("pageSize", page_size))
+        return self.client.get_model(self.endpoint, TaskListAPIResponse, params=params).data
+
+    async def list_async(self, page_num: int = 1, page_size: int = 30) -> List[TaskResponse]:
+        """List tasks asynchronously.
+
+        Args:
+            page_num: Page number (1-1000)
+            page_size: Items per page (1-500)
+
+        Returns:
+            List of task responses
+        """
+        params = (("pageNum", page_num), ("pageSize", page_size))
+        response = await self.client.get_model_async(
+            self.endpoint, TaskListAPIResponse, params=params
+        )
+        return response.data
+
+    async def list_all_async(self, pages: int, page_size: int = 30) -> List[TaskResponse]:
+        """List several pages of tasks concurrently.
+
+        The page requests are issued together and multiplexed over the shared
+        HTTP/2 connection.
+
+        Args:
+            pages: Number of pages to fetch, starting from page 1
+            page_size: Items per page (1-500)
+
+        Returns:
+            Tasks from all pages, in page order
+
+        Example:
+            >>> tasks = await client.text_to_video.list_all_async(pages=5, page_size=100)
+        """
+        results = await asyncio.gather(
+            *[self.list_async(page_num=i, page_size=page_size) for i in range(1, pages + 1)]
+        )
+        return [task for page in results for task in page]
+
+    def wait_for_completion(
+        self,
+        task_id: str,
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> TaskResponse:
+        """Wait for task to complete.
+
+        Args:
+            task_id: Task ID to wait for
+            poll_interval: Seconds before the first re-poll (default: 5)
+            timeout: Maximum wait time in seconds (default: 600)
+            max_poll_interval: Upper bound for the delay between polls (default: 30)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2)
+
+        Returns:
+            Completed task response
+        """
+        # Only reuse cached statuses younger than half a poll interval, so the
+        # wait's own polls always reach the server
+        return self.client.wait_for_completion(
+            task_id=task_id,
+            get_task_func=partial(self._get, max_age=poll_interval / 2),
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
+        )
+
+    async def wait_for_completion_async(
+        self,
+        task_id: str,
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> TaskResponse:
+        """Wait for task to complete asynchronously.
+
+        Args:
+            task_id: Task ID to wait for
+            poll_interval: Seconds before the first re-poll (default: 5)
+            timeout: Maximum wait time in seconds (default: 600)
+            max_poll_interval: Upper bound for the delay between polls (default: 30)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2)
+
+        Returns:
+            Completed task response
+        """
+        return await self.client.wait_for_completion_async(
+            task_id=task_id,
+            get_task_func=partial(self._get_async, max_age=poll_interval / 2),
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
+        )
+
+    async def wait_for_many_async(
+        self,
+        task_ids: Sequence[str],
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> Dict[str, TaskResponse]:
+        """Wait for several tasks to complete asynchronously.
+
+        Args:
+            task_ids: Task IDs to wait for
+            poll_interval: Seconds before the first re-poll (default: 5)
+            timeout: Maximum wait time in seconds (default: 600)
+            max_poll_interval: Upper bound for the delay between polls (default: 30)
+            backoff_factor: Multiplier applied to the delay after each poll (default: 2)
+
+        Returns:
+            Completed task responses keyed by task ID
+
+        Example:
+            >>> tasks = await asyncio.gather(
+            ...     *[client.video_effects.create_async(effect_scene=s, input=i) for s, i in jobs]
+            ... )
+            >>> results = await client.video_effects.wait_for_many_async(
+            ...     [t.task_id for t in tasks]
+            ... )
+        """
+        return await self.client.wait_for_many_async(
+            task_ids,
+            get_task_func=partial(self._get_async, max_age=poll_interval / 2),
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_poll_interval=max_poll_interval,
+            backoff_factor=backoff_factor,
+        )
@@ -1,5 +1,7 @@
 """Main Kling AI Client."""
 
+import asyncio
+import sys
 from typing import Optional
 from kling.base import BaseAPIClient
 from kling.api.text_to_video import TextToVideoAPI
@@ -63,6 +65,8 @@ class KlingClient:
         base_url: str = "https://api-singapore.klingai.com",
         timeout: float = 30.0,
         max_retries: int = 3,
+        max_concurrency: int = 16,
+        use_uvloop: bool = False,
     ):
         """Initialize the Kling AI client.
 
@@ -72,13 +76,28 @@ class KlingClient:
             base_url: Base URL for the API (default: Singapore endpoint)
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum retry attempts (default: 3)
+            max_concurrency: Maximum async requests in flight at once (default: 16)
+            use_uvloop: Install uvloop as the asyncio event loop policy (default: False).
+                Requires the ``uvloop`` extra and is ignored on Windows. Only
+                event loops created afterwards use it, so construct the client
+                before calling ``asyncio.run``.
         """
+        if use_uvloop and sys.platform != "win32":
+            try:
+                import uvloop
+            except ImportError as e:
+                raise ImportError(
+                    "use_uvloop=True requires uvloop: pip install 'kling-sdk[uvloop]'"
+                ) from e
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
         self._base_client = BaseAPIClient(
             access_key=access_key,
             secret_key=secret_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            max_concurrency=max_concurrency,
         )
 
         # Initialize all API endpoints
@@ -92,6 +111,28 @@ class KlingClient:
         self.video_to_audio = VideoToAudioAPI(self._base_client)
         self.tts = TTSAPI(self._base_client)
 
+    def warmup(self):
+        """Pre-establish the connection to the API host.
+
+        Pays the DNS and TLS handshake cost up front so that the first real
+        request does not.
+        """
+        self._base_client.warmup()
+
+    async def warmup_async(self):
+        """Pre-establish the async connection pool to the API host.
+
+        Call this once before an ``asyncio.gather`` burst so the handshake
+        overlaps with your own setup and the burst reuses the open connection.
+
+        Example:
+            >>> await client.warmup_async()
+            >>> tasks = await asyncio.gather(
+            ...     *[client.text_to_video.create_async(prompt=p) for p in prompts]
+            ... )
+        """
+        await self._base_client.warmup_async()
+
     def close(self):
         """Close HTTP clients."""
         self._base_client.close()
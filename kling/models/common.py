@@ -2,6 +2,7 @@
 
 from typing import Optional, List, Literal
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated
 
 
 # Task statuses
@@ -27,6 +28,12 @@ AspectRatio = Literal["16:9", "9:16", "1:1"]
 # Duration
 VideoDuration = Literal["5", "10"]
 
+# Classifier-free guidance scale; higher values follow the prompt more closely
+CfgScale = Annotated[float, Field(ge=0, le=1)]
+
+# Task callback URL; checked by pydantic-core's regex engine, no Url object is built
+CallbackUrl = Annotated[str, Field(pattern=r"^https?://\S+$")]
+
 
 class VideoResult(BaseModel):
     """Video result model."""
@@ -84,6 +91,15 @@ class APIResponse(BaseModel):
     data: Optional[TaskResponse] = Field(None, description="Response data")
 
 
+class TaskListAPIResponse(BaseModel):
+    """API response wrapper for task list endpoints."""
+
+    code: int = Field(..., description="Error code")
+    message: str = Field(..., description="Error message")
+    request_id: str = Field(..., description="Request ID generated by the system")
+    data: List[TaskResponse] = Field(default_factory=list, description="Tasks on the page")
+
+
 class CameraConfig(BaseModel):
     """Camera configuration for camera control."""
 
@@ -8,6 +8,12 @@ from kling.models.common import ModelName, VideoMode
 # All available effect scenes
 EffectScene = str  # Too many to enumerate, accept any string
 
+# Scenes whose input shape is known up front; anything else is sent as a plain dict
+SINGLE_IMAGE_EFFECT_SCENES = frozenset(
+    {"bloombloom", "dizzydizzy", "fuzzyfuzzy", "squish", "expansion", "pet_lion"}
+)
+DUAL_CHARACTER_EFFECT_SCENES = frozenset({"hug", "kiss", "heart_gesture"})
+
 
 class SingleImageEffectInput(BaseModel):
     """Input for single-image effects."""
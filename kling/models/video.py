@@ -1,26 +1,53 @@
 """Video generation Pydantic models."""
 
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional, List, Type, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing_extensions import Annotated, TypedDict
 from kling.models.common import (
     ModelName,
     VideoMode,
     AspectRatio,
     VideoDuration,
+    CfgScale,
+    CallbackUrl,
+    CameraConfig,
     CameraControl,
 )
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
 
-class DynamicMaskTrajectory(BaseModel):
+# Unknown parameters are rejected instead of silently dropped from the request,
+# and built requests are immutable
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
+def _construct(model: Type[_ModelT], value: Any) -> Any:
+    """``model_construct`` a nested dict, passing model instances and None through."""
+    if isinstance(value, dict):
+        return model.model_construct(**value)
+    return value
+
+
+def _construct_camera_control(value: Any) -> Any:
+    if isinstance(value, dict) and isinstance(value.get("config"), dict):
+        value = {**value, "config": CameraConfig.model_construct(**value["config"])}
+    return _construct(CameraControl, value)
+
+
+# A plain {"x": ..., "y": ...} dict rather than a model: a mask carries up to
+# 77 points, and validating into dicts avoids building an object per point.
+class DynamicMaskTrajectory(TypedDict):
     """Trajectory point for dynamic mask."""
 
-    x: int = Field(..., description="X-coordinate")
-    y: int = Field(..., description="Y-coordinate")
+    x: Annotated[int, Field(description="X-coordinate")]
+    y: Annotated[int, Field(description="Y-coordinate")]
 
 
 class DynamicMask(BaseModel):
     """Dynamic brush configuration."""
 
+    model_config = _REQUEST_CONFIG
+
     mask: str = Field(..., description="Mask image (Base64 or URL)")
     trajectories: List[DynamicMaskTrajectory] = Field(
         ...,
@@ -30,37 +57,61 @@ class DynamicMask(BaseModel):
     )
 
 
-class ImageInput(BaseModel):
+def _construct_dynamic_mask(value: Any) -> Any:
+    if isinstance(value, dict):
+        value = {**value, "trajectories": list(value["trajectories"])}
+    return _construct(DynamicMask, value)
+
+
+# A plain {"image": ...} dict for the same reason as DynamicMaskTrajectory
+class ImageInput(TypedDict):
     """Image input for multi-image to video."""
 
-    image: str = Field(..., description="Image URL or Base64")
+    image: Annotated[str, Field(description="Image URL or Base64")]
 
 
 class TextToVideoRequest(BaseModel):
     """Text to video request parameters."""
 
-    model_name: Optional[ModelName] = Field("kling-v1", description="Model version")
+    model_config = _REQUEST_CONFIG
+
+    model_name: ModelName = Field("kling-v1", description="Model version")
     prompt: str = Field(..., max_length=2500, description="Positive text prompt")
     negative_prompt: Optional[str] = Field(None, max_length=2500, description="Negative prompt")
-    cfg_scale: Optional[float] = Field(0.5, ge=0, le=1, description="CFG scale")
-    mode: Optional[VideoMode] = Field("std", description="Video generation mode")
+    cfg_scale: CfgScale = Field(0.5, description="CFG scale")
+    mode: VideoMode = Field("std", description="Video generation mode")
     camera_control: Optional[CameraControl] = Field(None, description="Camera control")
-    aspect_ratio: Optional[AspectRatio] = Field("16:9", description="Aspect ratio")
-    duration: Optional[VideoDuration] = Field("5", description="Video duration in seconds")
-    callback_url: Optional[str] = Field(None, description="Callback URL")
+    aspect_ratio: AspectRatio = Field("16:9", description="Aspect ratio")
+    duration: VideoDuration = Field("5", description="Video duration in seconds")
+    callback_url: Optional[CallbackUrl] = Field(None, description="Callback URL")
     external_task_id: Optional[str] = Field(None, description="External task ID")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TextToVideoRequest":
+        """Build a request from data known to be valid, skipping validation.
+
+        Only for payloads that were already validated, such as a request
+        reloaded from its own ``model_dump()``. Nested models are constructed
+        too, but nothing is checked.
+        """
+        data = dict(data)
+        if "camera_control" in data:
+            data["camera_control"] = _construct_camera_control(data["camera_control"])
+        return cls.model_construct(**data)
+
 
 class ImageToVideoRequest(BaseModel):
     """Image to video request parameters."""
 
-    model_name: Optional[ModelName] = Field("kling-v1", description="Model version")
+    model_config = _REQUEST_CONFIG
+
+    model_name: ModelName = Field("kling-v1", description="Model version")
     image: Optional[str] = Field(None, description="Reference image (Base64 or URL)")
     image_tail: Optional[str] = Field(None, description="End frame image (Base64 or URL)")
     prompt: Optional[str] = Field(None, max_length=2500, description="Positive text prompt")
     negative_prompt: Optional[str] = Field(None, max_length=2500, description="Negative prompt")
-    cfg_scale: Optional[float] = Field(0.5, ge=0, le=1, description="CFG scale")
-    mode: Optional[VideoMode] = Field("std", description="Video generation mode")
+    cfg_scale: CfgScale = Field(0.5, description="CFG scale")
+    mode: VideoMode = Field("std", description="Video generation mode")
     static_mask: Optional[str] = Field(None, description="Static mask image")
     dynamic_masks: Optional[List[DynamicMask]] = Field(
         None,
@@ -68,15 +119,27 @@ class ImageToVideoRequest(BaseModel):
         description="Dynamic brush configurations",
     )
     camera_control: Optional[CameraControl] = Field(None, description="Camera control")
-    duration: Optional[VideoDuration] = Field("5", description="Video duration in seconds")
-    callback_url: Optional[str] = Field(None, description="Callback URL")
+    duration: VideoDuration = Field("5", description="Video duration in seconds")
+    callback_url: Optional[CallbackUrl] = Field(None, description="Callback URL")
     external_task_id: Optional[str] = Field(None, description="External task ID")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ImageToVideoRequest":
+        """Build a request from already-validated data (see ``TextToVideoRequest.from_trusted``)."""
+        data = dict(data)
+        if "camera_control" in data:
+            data["camera_control"] = _construct_camera_control(data["camera_control"])
+        if data.get("dynamic_masks") is not None:
+            data["dynamic_masks"] = [_construct_dynamic_mask(m) for m in data["dynamic_masks"]]
+        return cls.model_construct(**data)
+
 
 class MultiImageToVideoRequest(BaseModel):
     """Multi-image to video request parameters (Elements)."""
 
-    model_name: Optional[ModelName] = Field("kling-v1-6", description="Model version")
+    model_config = _REQUEST_CONFIG
+
+    model_name: ModelName = Field("kling-v1-6", description="Model version")
     image_list: List[ImageInput] = Field(
         ...,
         min_length=1,
@@ -85,18 +148,42 @@ class MultiImageToVideoRequest(BaseModel):
     )
     prompt: str = Field(..., max_length=2500, description="Positive text prompt")
     negative_prompt: Optional[str] = Field(None, max_length=2500, description="Negative prompt")
-    mode: Optional[VideoMode] = Field("std", description="Video generation mode")
-    duration: Optional[VideoDuration] = Field("5", description="Video duration in seconds")
-    aspect_ratio: Optional[AspectRatio] = Field("16:9", description="Aspect ratio")
-    callback_url: Optional[str] = Field(None, description="Callback URL")
+    mode: VideoMode = Field("std", description="Video generation mode")
+    duration: VideoDuration = Field("5", description="Video duration in seconds")
+    aspect_ratio: AspectRatio = Field("16:9", description="Aspect ratio")
+    callback_url: Optional[CallbackUrl] = Field(None, description="Callback URL")
     external_task_id: Optional[str] = Field(None, description="External task ID")
 
+    @field_validator("image_list", mode="before")
+    @classmethod
+    def _wrap_image_strings(cls, value):
+        """Accept bare image URLs/Base64 strings alongside ``{"image": ...}`` dicts."""
+        if isinstance(value, list):
+            return [{"image": item} if isinstance(item, str) else item for item in value]
+        return value
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "MultiImageToVideoRequest":
+        """Build a request from already-validated data (see ``TextToVideoRequest.from_trusted``)."""
+        data = dict(data)
+        data["image_list"] = [
+            {"image": item} if isinstance(item, str) else item for item in data["image_list"]
+        ]
+        return cls.model_construct(**data)
+
 
 class VideoExtensionRequest(BaseModel):
     """Video extension request parameters."""
 
+    model_config = _REQUEST_CONFIG
+
     video_id: str = Field(..., description="Video ID to extend")
     prompt: Optional[str] = Field(None, max_length=2500, description="Text prompt")
     negative_prompt: Optional[str] = Field(None, max_length=2500, description="Negative prompt")
-    cfg_scale: Optional[float] = Field(0.5, ge=0, le=1, description="CFG scale")
-    callback_url: Optional[str] = Field(None, description="Callback URL")
+    cfg_scale: CfgScale = Field(0.5, description="CFG scale")
+    callback_url: Optional[CallbackUrl] = Field(None, description="Callback URL")
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "VideoExtensionRequest":
+        """Build a request from already-validated data (see ``TextToVideoRequest.from_trusted``)."""
+        return cls.model_construct(**data)
@@ -0,0 +1,105 @@
+"""Tests for the shared async poll scheduler."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from kling import KlingClient
+from kling.exceptions import KlingTimeoutError
+
+
+def _task_body(task_id: str, status: str) -> dict:
+    return {
+        "code": 0,
+        "message": "SUCCEED",
+        "request_id": "req",
+        "data": {"task_id": task_id, "task_status": status, "created_at": 1, "updated_at": 1},
+    }
+
+
+def _client_with_handler(handler) -> KlingClient:
+    client = KlingClient(access_key="ak-test", secret_key="sk-test-secret-key-for-hs256-signing")
+    client._base_client._async_poll_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_slow_poll_does_not_block_other_waiters():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        if task_id == "slow":
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json=_task_body(task_id, "processing"))
+        return httpx.Response(200, json=_task_body(task_id, "succeed"))
+
+    async def main():
+        client = _client_with_handler(handler)
+        slow = asyncio.ensure_future(
+            client.avatar.wait_for_completion_async("slow", timeout=0.5)
+        )
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        fast = await client.avatar.wait_for_completion_async("fast", timeout=0.4)
+        elapsed = time.monotonic() - start
+        with pytest.raises(KlingTimeoutError):
+            await slow
+        await client.close_async()
+        return fast, elapsed
+
+    fast, elapsed = asyncio.run(main())
+    assert fast.task_status == "succeed"
+    assert elapsed < 0.2
+
+
+def test_waiters_on_one_task_share_polls_and_release_it():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        status = "succeed" if len(calls) >= 2 else "processing"
+        return httpx.Response(200, json=_task_body("t", status))
+
+    async def main():
+        client = _client_with_handler(handler)
+        results = await asyncio.gather(
+            *[
+                client.avatar.wait_for_completion_async("t", poll_interval=0.05)
+                for _ in range(3)
+            ]
+        )
+        scheduler = client._base_client._poll_scheduler
+        await client.close_async()
+        return results, scheduler
+
+    results, scheduler = asyncio.run(main())
+    assert [task.task_status for task in results] == ["succeed"] * 3
+    assert len(calls) == 2
+    assert scheduler._waiters == {}
+
+
+def test_timed_out_wait_cancels_its_poll_and_unregisters():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.path)
+            raise
+        return httpx.Response(200, json=_task_body("t", "succeed"))
+
+    async def main():
+        client = _client_with_handler(handler)
+        with pytest.raises(KlingTimeoutError):
+            await client.avatar.wait_for_completion_async("t", timeout=0.1)
+        await asyncio.sleep(0.05)
+        scheduler = client._base_client._poll_scheduler
+        await client.close_async()
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    assert scheduler._waiters == {}
+    assert len(cancelled) == 1